@@ -1,15 +1,22 @@
 from __future__ import annotations
 
 import os
+import re
 import socket
-from datetime import datetime
+import time
+from collections import defaultdict
+from datetime import date, datetime
+from functools import lru_cache
+from itertools import count
 
-from typing import Dict, List
-from uuid import UUID
+from typing import Annotated, Any, Callable, Dict, Iterable, List, Set, Tuple, TypeVar
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi import Query, Path
+from pydantic import AfterValidator, BaseModel, TypeAdapter, ValidationError, WithJsonSchema
+from pydantic_core import PydanticCustomError
 from typing import Optional
+from uuid import UUID
 
 from models.person import PersonCreate, PersonRead, PersonUpdate
 from models.address import AddressCreate, AddressRead, AddressUpdate
@@ -21,11 +28,266 @@ port = int(os.environ.get("FASTAPIPORT", 8000))
 
 # -----------------------------------------------------------------------------
 # Fake in-memory "databases"
+#
+# Keyed by the 16 raw bytes of each object's UUID: path ids in either canonical
+# form (32 hex digits, or 8-4-4-4-12 with every hyphen) are converted with
+# bytes.fromhex, so a lookup never builds or hashes a uuid.UUID. The models
+# themselves still carry `id: UUID`.
 # -----------------------------------------------------------------------------
-persons: Dict[UUID, PersonRead] = {}
-addresses: Dict[UUID, AddressRead] = {}
-courses: Dict[UUID, CourseRead] = {}
-enrollments: Dict[UUID, EnrollmentRead] = {}
+UUID_PATTERN = (
+    r"[0-9a-fA-F]{32}"
+    r"|[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"
+)
+_UUID_RE = re.compile(UUID_PATTERN)
+_UUID_ADAPTER = TypeAdapter(UUID)
+
+
+def check_uuid(value: str) -> str:
+    """Accept exactly the path ids a `UUID` parameter would, with the same errors.
+
+    Only ids outside the two canonical forms (braced, urn:uuid:, anything
+    malformed) pay for a full UUID parse, which also produces the error.
+    """
+    if _UUID_RE.fullmatch(value) is None:
+        try:
+            _UUID_ADAPTER.validate_python(value)
+        except ValidationError as exc:
+            err = exc.errors()[0]
+            raise PydanticCustomError(err["type"], err["msg"], err.get("ctx")) from None
+    return value
+
+
+UUIDStr = Annotated[
+    str,
+    Path(description="Resource UUID"),
+    AfterValidator(check_uuid),
+    WithJsonSchema({"type": "string", "format": "uuid"}),
+]
+
+
+def id_key(value: str) -> bytes:
+    if _UUID_RE.fullmatch(value) is not None:
+        return bytes.fromhex(value.replace("-", ""))
+    return UUID(value).bytes
+
+persons: Dict[bytes, PersonRead] = {}
+addresses: Dict[bytes, AddressRead] = {}
+courses: Dict[bytes, CourseRead] = {}
+enrollments: Dict[bytes, EnrollmentRead] = {}
+
+# Serialized JSON body of every stored object, refreshed on each write so every
+# endpoint returning a stored object can send bytes without re-validating and
+# re-encoding the model.
+addresses_json: Dict[bytes, bytes] = {}
+persons_json: Dict[bytes, bytes] = {}
+courses_json: Dict[bytes, bytes] = {}
+enrollments_json: Dict[bytes, bytes] = {}
+
+# Insertion sequence number of every stored object, so index-driven list results
+# come back in the same (creation) order as an unfiltered listing.
+addresses_order: Dict[bytes, int] = {}
+persons_order: Dict[bytes, int] = {}
+courses_order: Dict[bytes, int] = {}
+enrollments_order: Dict[bytes, int] = {}
+insertion_seq = count()
+
+# -----------------------------------------------------------------------------
+# Secondary hash indices: field name -> field value -> set of object ids.
+# Equality filters on the list endpoints become set lookups + intersection
+# instead of one full scan per filter. A field whose value is a frozenset is
+# indexed under each of its members (e.g. every city a person has an address in).
+# -----------------------------------------------------------------------------
+IndexType = Dict[str, Dict[Any, Set[bytes]]]
+
+address_index: IndexType = {
+    f: defaultdict(set) for f in ("street", "city", "state", "postal_code", "country")
+}
+person_index: IndexType = {
+    f: defaultdict(set) for f in (
+        "uni", "first_name", "last_name", "email", "phone", "birth_date", "address_cities", "address_countries",
+    )
+}
+course_index: IndexType = {
+    f: defaultdict(set) for f in ("course_id", "department", "instructor_uni", "semester", "credits")
+}
+enrollment_index: IndexType = {
+    f: defaultdict(set) for f in ("student_uni", "course_id", "status", "enrollment_date", "grade")
+}
+
+
+def index_keys(obj: Any, field: str) -> Iterable[Any]:
+    value = getattr(obj, field)
+    return value if isinstance(value, frozenset) else (value,)
+
+
+def index_add(index: IndexType, obj_id: bytes, obj: Any) -> None:
+    for field, postings in index.items():
+        for value in index_keys(obj, field):
+            postings[value].add(obj_id)
+
+
+def index_remove(index: IndexType, obj_id: bytes, obj: Any) -> None:
+    for field, postings in index.items():
+        for value in index_keys(obj, field):
+            ids = postings.get(value)
+            if ids is not None:
+                ids.discard(obj_id)
+                if not ids:
+                    del postings[value]
+
+
+def save(
+    store: Dict[bytes, Any],
+    index: IndexType,
+    cache: Dict[bytes, bytes],
+    order: Dict[bytes, int],
+    obj_id: bytes,
+    obj: Any,
+) -> None:
+    """Store obj under obj_id, keeping its indices, cached JSON and insertion order in step.
+
+    Handlers run concurrently in FastAPI's threadpool, so the cached body and
+    order are written before the object becomes reachable through the store
+    or the index.
+    """
+    cache[obj_id] = obj.model_dump_json().encode()
+    if obj_id not in order:
+        order[obj_id] = next(insertion_seq)
+    previous = store.get(obj_id)
+    store[obj_id] = obj
+    if previous is not None:
+        index_remove(index, obj_id, previous)
+    index_add(index, obj_id, obj)
+
+
+def discard(
+    store: Dict[bytes, Any],
+    index: IndexType,
+    cache: Dict[bytes, bytes],
+    order: Dict[bytes, int],
+    obj_id: bytes,
+) -> Any:
+    # Reverse of save(): unreachable through the index, then the store, and
+    # only then drop the cached body.
+    removed = store[obj_id]
+    index_remove(index, obj_id, removed)
+    del store[obj_id]
+    del cache[obj_id]
+    order.pop(obj_id, None)
+    return removed
+
+
+def index_lookup(
+    index: IndexType,
+    store: Dict[bytes, Any],
+    order: Dict[bytes, int],
+    candidates: Optional[List[Set[bytes]]] = None,
+    predicate: Optional[Callable[[Any], bool]] = None,
+    **filters: Any,
+) -> List[bytes]:
+    """Return the keys of stored objects matching every non-None equality filter (and in every candidate set).
+
+    Filters the index cannot answer exactly go in `predicate`, which is checked
+    while the result list is built rather than in a second pass over it. Keys
+    rather than objects are returned: the list endpoints only need them to
+    pick cached JSON bodies. Keys come back in insertion order either way.
+    """
+    candidate_sets = [index[field].get(value, set()) for field, value in filters.items() if value is not None]
+    if candidates:
+        candidate_sets.extend(candidates)
+    if not candidate_sets:
+        # Snapshot (in C) rather than iterate the live dict from Python code.
+        ids = list(store)
+    else:
+        # Most selective posting set first, so each intersection walks the
+        # fewest ids; stop as soon as nothing can match.
+        candidate_sets.sort(key=len)
+        # Copy so the list below never iterates a live posting set that a
+        # concurrent write could resize.
+        ids = candidate_sets[0].copy()
+        for other in candidate_sets[1:]:
+            if not ids:
+                break
+            ids = ids & other
+        ids = sorted(ids, key=lambda k: order.get(k, -1))
+    if predicate is None:
+        return list(ids)
+    # A key may have been discarded since the index was read; skip it.
+    return [i for i in ids if (obj := store.get(i)) is not None and predicate(obj)]
+
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def apply_patch(stored: ModelT, update: BaseModel) -> ModelT:
+    """Copy a stored model with the fields set on a PATCH body applied.
+
+    Only the changed fields are re-validated, rather than dumping the whole
+    model to a dict and rebuilding it.
+    """
+    patched = stored.model_copy()
+    validator = type(stored).__pydantic_validator__
+    for field in update.model_fields_set:
+        validator.validate_assignment(patched, field, getattr(update, field))
+    patched.updated_at = datetime.utcnow()
+    # Refresh any cached derived state (e.g. CourseRead's lowercased name).
+    patched.model_post_init(None)
+    return patched
+
+
+def etag_for(obj: Any) -> str:
+    return f'W/"{obj.updated_at.timestamp()}-{obj.id}"'
+
+
+def strip_weak(tag: str) -> str:
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def json_response(body: bytes, **kwargs: Any) -> Response:
+    return Response(content=body, media_type="application/json", **kwargs)
+
+
+def json_list_response(keys: List[bytes], cache: Dict[bytes, bytes]) -> Response:
+    # Objects deleted after index_lookup ran have no body any more; leave them out.
+    bodies = [body for body in map(cache.get, keys) if body is not None]
+    return json_response(b"[" + b",".join(bodies) + b"]")
+
+
+def conditional_get(request: Request, obj: Any, body: bytes) -> Response:
+    """Send obj's cached JSON body, or 304 when If-None-Match already names its current version."""
+    etag = etag_for(obj)
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        # Weak comparison (RFC 9110 13.1.2): ignore any W/ prefix on either side.
+        tags = {strip_weak(t.strip()) for t in if_none_match.split(",")}
+        if strip_weak(etag) in tags or "*" in tags:
+            return Response(status_code=304, headers={"ETag": etag})
+    return json_response(body, headers={"ETag": etag})
+
+
+# Course name substring search: lowercase trigram -> course ids. Any course whose
+# name contains the query contains every trigram of the query, so intersecting
+# the posting sets yields a superset of the matches that only needs verifying.
+course_name_trigrams: Dict[str, Set[bytes]] = defaultdict(set)
+
+
+def trigrams(text: str) -> Set[str]:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def name_index_add(key: bytes, course: CourseRead) -> None:
+    for gram in trigrams(course.name_lower):
+        course_name_trigrams[gram].add(key)
+
+
+def name_index_remove(key: bytes, course: CourseRead) -> None:
+    for gram in trigrams(course.name_lower):
+        ids = course_name_trigrams.get(gram)
+        if ids is not None:
+            ids.discard(key)
+            if not ids:
+                del course_name_trigrams[gram]
+
 
 app = FastAPI(
     title="University Management API",
@@ -37,18 +299,51 @@ app = FastAPI(
 # Address endpoints
 # -----------------------------------------------------------------------------
 
+@lru_cache(maxsize=1)
+def host_ip() -> str:
+    # Resolved once; the hostname lookup can block and /health is polled constantly.
+    return socket.gethostbyname(socket.gethostname())
+
+# (second, "YYYY-MM-DDTHH:MM:SS") of the last formatted timestamp.
+_iso_second_cache: Tuple[int, str] = (-1, "")
+
+def utc_iso_now() -> str:
+    """Current UTC time as ISO 8601 with microseconds and a Z suffix.
+
+    Only the fractional part is formatted per call; the date/time prefix is
+    rebuilt once per second.
+    """
+    global _iso_second_cache
+    t = time.time()
+    second = int(t)
+    cached_second, prefix = _iso_second_cache
+    if cached_second != second:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+        _iso_second_cache = (second, prefix)
+    return f"{prefix}.{int((t - second) * 1e6):06d}Z"
+
 def make_health(echo: Optional[str], path_echo: Optional[str]=None) -> Health:
     return Health(
         status=200,
         status_message="OK",
-        timestamp=datetime.utcnow().isoformat() + "Z",
-        ip_address=socket.gethostbyname(socket.gethostname()),
+        timestamp=utc_iso_now(),
+        ip_address=host_ip(),
         echo=echo,
         path_echo=path_echo
     )
 
+# (second, body) of the last plain /health response: probes without an echo
+# arriving within the same second share one serialized body.
+health_cache: Tuple[int, bytes] = (-1, b"")
+
 @app.get("/health", response_model=Health)
 def get_health_no_path(echo: str | None = Query(None, description="Optional echo string")):
+    global health_cache
+    if echo is None:
+        second = int(time.time())
+        if health_cache[0] != second:
+            health_cache = (second, make_health(echo=None).model_dump_json().encode())
+        return json_response(health_cache[1])
     # Works because path_echo is optional in the model
     return make_health(echo=echo, path_echo=None)
 
@@ -61,10 +356,12 @@ def get_health_with_path(
 
 @app.post("/addresses", response_model=AddressRead, status_code=201)
 def create_address(address: AddressCreate):
-    if address.id in addresses:
+    key = address.id.bytes
+    if key in addresses:
         raise HTTPException(status_code=400, detail="Address with this ID already exists")
-    addresses[address.id] = AddressRead(**address.model_dump())
-    return addresses[address.id]
+    address_read = AddressRead.model_construct(**address.__dict__)
+    save(addresses, address_index, addresses_json, addresses_order, key, address_read)
+    return json_response(addresses_json[key], status_code=201)
 
 @app.get("/addresses", response_model=List[AddressRead])
 def list_addresses(
@@ -74,45 +371,40 @@ def list_addresses(
     postal_code: Optional[str] = Query(None, description="Filter by postal code"),
     country: Optional[str] = Query(None, description="Filter by country"),
 ):
-    results = list(addresses.values())
-
-    if street is not None:
-        results = [a for a in results if a.street == street]
-    if city is not None:
-        results = [a for a in results if a.city == city]
-    if state is not None:
-        results = [a for a in results if a.state == state]
-    if postal_code is not None:
-        results = [a for a in results if a.postal_code == postal_code]
-    if country is not None:
-        results = [a for a in results if a.country == country]
-
-    return results
+    keys = index_lookup(
+        address_index, addresses, addresses_order,
+        street=street, city=city, state=state, postal_code=postal_code, country=country,
+    )
+    return json_list_response(keys, addresses_json)
 
 @app.get("/addresses/{address_id}", response_model=AddressRead)
-def get_address(address_id: UUID):
-    if address_id not in addresses:
+def get_address(address_id: UUIDStr, request: Request):
+    key = id_key(address_id)
+    # .get() on both: a concurrent delete may land between the two lookups.
+    address = addresses.get(key)
+    body = addresses_json.get(key)
+    if address is None or body is None:
         raise HTTPException(status_code=404, detail="Address not found")
-    return addresses[address_id]
+    return conditional_get(request, address, body)
 
 @app.patch("/addresses/{address_id}", response_model=AddressRead)
-def update_address(address_id: UUID, update: AddressUpdate):
-    if address_id not in addresses:
+def update_address(address_id: UUIDStr, update: AddressUpdate):
+    key = id_key(address_id)
+    if key not in addresses:
         raise HTTPException(status_code=404, detail="Address not found")
-    stored = addresses[address_id].model_dump()
-    stored.update(update.model_dump(exclude_unset=True))
-    addresses[address_id] = AddressRead(**stored)
-    return addresses[address_id]
+    save(addresses, address_index, addresses_json, addresses_order, key, apply_patch(addresses[key], update))
+    return json_response(addresses_json[key])
 
 # -----------------------------------------------------------------------------
 # Person endpoints
 # -----------------------------------------------------------------------------
 @app.post("/persons", response_model=PersonRead, status_code=201)
 def create_person(person: PersonCreate):
-    # Each person gets its own UUID; stored as PersonRead
-    person_read = PersonRead(**person.model_dump())
-    persons[person_read.id] = person_read
-    return person_read
+    # Each person gets its own UUID; stored as PersonRead. The payload is already
+    # validated, so promote it without a second validation pass.
+    person_read = PersonRead.model_construct(**person.__dict__)
+    save(persons, person_index, persons_json, persons_order, person_read.id.bytes, person_read)
+    return json_response(persons_json[person_read.id.bytes], status_code=201)
 
 @app.get("/persons", response_model=List[PersonRead])
 def list_persons(
@@ -121,47 +413,35 @@ def list_persons(
     last_name: Optional[str] = Query(None, description="Filter by last name"),
     email: Optional[str] = Query(None, description="Filter by email"),
     phone: Optional[str] = Query(None, description="Filter by phone number"),
-    birth_date: Optional[str] = Query(None, description="Filter by date of birth (YYYY-MM-DD)"),
+    birth_date: Optional[date] = Query(None, description="Filter by date of birth (YYYY-MM-DD)"),
     city: Optional[str] = Query(None, description="Filter by city of at least one address"),
     country: Optional[str] = Query(None, description="Filter by country of at least one address"),
 ):
-    results = list(persons.values())
-
-    if uni is not None:
-        results = [p for p in results if p.uni == uni]
-    if first_name is not None:
-        results = [p for p in results if p.first_name == first_name]
-    if last_name is not None:
-        results = [p for p in results if p.last_name == last_name]
-    if email is not None:
-        results = [p for p in results if p.email == email]
-    if phone is not None:
-        results = [p for p in results if p.phone == phone]
-    if birth_date is not None:
-        results = [p for p in results if str(p.birth_date) == birth_date]
-
-    # nested address filtering
-    if city is not None:
-        results = [p for p in results if any(addr.city == city for addr in p.addresses)]
-    if country is not None:
-        results = [p for p in results if any(addr.country == country for addr in p.addresses)]
-
-    return results
+    keys = index_lookup(
+        person_index, persons, persons_order,
+        uni=uni, first_name=first_name, last_name=last_name, email=email, phone=phone,
+        birth_date=birth_date,
+        # nested address filtering
+        address_cities=city, address_countries=country,
+    )
+    return json_list_response(keys, persons_json)
 
 @app.get("/persons/{person_id}", response_model=PersonRead)
-def get_person(person_id: UUID):
-    if person_id not in persons:
+def get_person(person_id: UUIDStr, request: Request):
+    key = id_key(person_id)
+    person = persons.get(key)
+    body = persons_json.get(key)
+    if person is None or body is None:
         raise HTTPException(status_code=404, detail="Person not found")
-    return persons[person_id]
+    return conditional_get(request, person, body)
 
 @app.patch("/persons/{person_id}", response_model=PersonRead)
-def update_person(person_id: UUID, update: PersonUpdate):
-    if person_id not in persons:
+def update_person(person_id: UUIDStr, update: PersonUpdate):
+    key = id_key(person_id)
+    if key not in persons:
         raise HTTPException(status_code=404, detail="Person not found")
-    stored = persons[person_id].model_dump()
-    stored.update(update.model_dump(exclude_unset=True))
-    persons[person_id] = PersonRead(**stored)
-    return persons[person_id]
+    save(persons, person_index, persons_json, persons_order, key, apply_patch(persons[key], update))
+    return json_response(persons_json[key])
 
 # -----------------------------------------------------------------------------
 # Course endpoints
@@ -169,9 +449,10 @@ def update_person(person_id: UUID, update: PersonUpdate):
 @app.post("/courses", response_model=CourseRead, status_code=201)
 def create_course(course: CourseCreate):
     # Each course gets its own UUID; stored as CourseRead
-    course_read = CourseRead(**course.model_dump())
-    courses[course_read.id] = course_read
-    return course_read
+    course_read = CourseRead.model_construct(**course.__dict__)
+    save(courses, course_index, courses_json, courses_order, course_read.id.bytes, course_read)
+    name_index_add(course_read.id.bytes, course_read)
+    return json_response(courses_json[course_read.id.bytes], status_code=201)
 
 @app.get("/courses", response_model=List[CourseRead])
 def list_courses(
@@ -182,130 +463,158 @@ def list_courses(
     semester: Optional[str] = Query(None, description="Filter by semester"),
     credits: Optional[int] = Query(None, description="Filter by number of credits"),
 ):
-    results = list(courses.values())
-
-    if course_id is not None:
-        results = [c for c in results if c.course_id == course_id]
+    name_candidates = None
+    name_matches = None
     if name is not None:
-        results = [c for c in results if name.lower() in c.name.lower()]
-    if department is not None:
-        results = [c for c in results if c.department == department]
-    if instructor_uni is not None:
-        results = [c for c in results if c.instructor_uni == instructor_uni]
-    if semester is not None:
-        results = [c for c in results if c.semester == semester]
-    if credits is not None:
-        results = [c for c in results if c.credits == credits]
-
-    return results
+        q = name.lower()
+        # Trigram postings narrow the candidates; the substring check confirms
+        # them (and is the whole filter for queries shorter than a trigram).
+        name_candidates = [course_name_trigrams.get(g, set()) for g in trigrams(q)]
+        name_matches = lambda c: q in c.name_lower
+
+    keys = index_lookup(
+        course_index, courses, courses_order, name_candidates, name_matches,
+        course_id=course_id, department=department, instructor_uni=instructor_uni,
+        semester=semester, credits=credits,
+    )
+
+    return json_list_response(keys, courses_json)
 
 @app.get("/courses/{course_uuid}", response_model=CourseRead)
-def get_course(course_uuid: UUID):
-    if course_uuid not in courses:
+def get_course(course_uuid: UUIDStr, request: Request):
+    key = id_key(course_uuid)
+    course = courses.get(key)
+    body = courses_json.get(key)
+    if course is None or body is None:
         raise HTTPException(status_code=404, detail="Course not found")
-    return courses[course_uuid]
+    return conditional_get(request, course, body)
 
 @app.patch("/courses/{course_uuid}", response_model=CourseRead)
-def update_course(course_uuid: UUID, update: CourseUpdate):
-    if course_uuid not in courses:
+def update_course(course_uuid: UUIDStr, update: CourseUpdate):
+    key = id_key(course_uuid)
+    if key not in courses:
         raise HTTPException(status_code=404, detail="Course not found")
-    stored = courses[course_uuid].model_dump()
-    stored.update(update.model_dump(exclude_unset=True))
-    courses[course_uuid] = CourseRead(**stored)
-    return courses[course_uuid]
+    updated = apply_patch(courses[key], update)
+    name_index_remove(key, courses[key])
+    save(courses, course_index, courses_json, courses_order, key, updated)
+    name_index_add(key, updated)
+    return json_response(courses_json[key])
 
 @app.put("/courses/{course_uuid}", response_model=CourseRead)
-def replace_course(course_uuid: UUID, course: CourseCreate):
+def replace_course(course_uuid: UUIDStr, course: CourseCreate):
     """Replace entire course resource (PUT - complete replacement)."""
-    if course_uuid not in courses:
+    key = id_key(course_uuid)
+    if key not in courses:
         raise HTTPException(status_code=404, detail="Course not found")
-    existing = courses[course_uuid]
-    course_read = CourseRead(
-        id=course_uuid,
+    existing = courses[key]
+    course_read = CourseRead.model_construct(
+        id=existing.id,
         created_at=existing.created_at,  
         updated_at=datetime.utcnow(),    # Update the modification time
-        **course.model_dump()
+        **course.__dict__
     )
-    courses[course_uuid] = course_read
-    return course_read
+    name_index_remove(key, existing)
+    save(courses, course_index, courses_json, courses_order, key, course_read)
+    name_index_add(key, course_read)
+    return json_response(courses_json[key])
 
 @app.delete("/courses/{course_uuid}")
-def delete_course(course_uuid: UUID):
+def delete_course(course_uuid: UUIDStr):
     """Delete a course resource."""
-    if course_uuid not in courses:
+    key = id_key(course_uuid)
+    if key not in courses:
         raise HTTPException(status_code=404, detail="Course not found")
-    del courses[course_uuid]
+    name_index_remove(key, discard(courses, course_index, courses_json, courses_order, key))
     return {"message": "Course deleted successfully"}
 
+def bulk_create_courses(rows: Iterable[Dict[str, Any]]) -> Tuple[List[CourseRead], List[int]]:
+    """Validate and store many courses at once (seed data / imports).
+
+    Returns the stored courses and the positions of rows that failed validation.
+    """
+    validate = CourseCreate.__pydantic_validator__.validate_python
+    now = datetime.utcnow()
+    created: List[CourseRead] = []
+    rejected: List[int] = []
+    for i, row in enumerate(rows):
+        try:
+            course = validate(row)
+        except ValidationError:
+            rejected.append(i)
+            continue
+        course_read = CourseRead.model_construct(created_at=now, updated_at=now, **course.__dict__)
+        key = course_read.id.bytes
+        save(courses, course_index, courses_json, courses_order, key, course_read)
+        name_index_add(key, course_read)
+        created.append(course_read)
+    return created, rejected
+
 # -----------------------------------------------------------------------------
 # Enrollment endpoints
 # -----------------------------------------------------------------------------
 @app.post("/enrollments", response_model=EnrollmentRead, status_code=201)
 def create_enrollment(enrollment: EnrollmentCreate):
     # Each enrollment gets its own UUID; stored as EnrollmentRead
-    enrollment_read = EnrollmentRead(**enrollment.model_dump())
-    enrollments[enrollment_read.id] = enrollment_read
-    return enrollment_read
+    enrollment_read = EnrollmentRead.model_construct(**enrollment.__dict__)
+    save(enrollments, enrollment_index, enrollments_json, enrollments_order, enrollment_read.id.bytes, enrollment_read)
+    return json_response(enrollments_json[enrollment_read.id.bytes], status_code=201)
 
 @app.get("/enrollments", response_model=List[EnrollmentRead])
 def list_enrollments(
     student_uni: Optional[str] = Query(None, description="Filter by student UNI"),
     course_id: Optional[str] = Query(None, description="Filter by course ID"),
     status: Optional[EnrollmentStatus] = Query(None, description="Filter by enrollment status"),
-    enrollment_date: Optional[str] = Query(None, description="Filter by enrollment date (YYYY-MM-DD)"),
+    enrollment_date: Optional[date] = Query(None, description="Filter by enrollment date (YYYY-MM-DD)"),
     grade: Optional[str] = Query(None, description="Filter by grade"),
 ):
-    results = list(enrollments.values())
-
-    if student_uni is not None:
-        results = [e for e in results if e.student_uni == student_uni]
-    if course_id is not None:
-        results = [e for e in results if e.course_id == course_id]
-    if status is not None:
-        results = [e for e in results if e.status == status]
-    if enrollment_date is not None:
-        results = [e for e in results if str(e.enrollment_date) == enrollment_date]
-    if grade is not None:
-        results = [e for e in results if e.grade == grade]
-
-    return results
+    keys = index_lookup(
+        enrollment_index, enrollments, enrollments_order,
+        student_uni=student_uni, course_id=course_id, status=status,
+        enrollment_date=enrollment_date, grade=grade,
+    )
+    return json_list_response(keys, enrollments_json)
 
 @app.get("/enrollments/{enrollment_id}", response_model=EnrollmentRead)
-def get_enrollment(enrollment_id: UUID):
-    if enrollment_id not in enrollments:
+def get_enrollment(enrollment_id: UUIDStr, request: Request):
+    key = id_key(enrollment_id)
+    enrollment = enrollments.get(key)
+    body = enrollments_json.get(key)
+    if enrollment is None or body is None:
         raise HTTPException(status_code=404, detail="Enrollment not found")
-    return enrollments[enrollment_id]
+    return conditional_get(request, enrollment, body)
 
 @app.patch("/enrollments/{enrollment_id}", response_model=EnrollmentRead)
-def update_enrollment(enrollment_id: UUID, update: EnrollmentUpdate):
-    if enrollment_id not in enrollments:
+def update_enrollment(enrollment_id: UUIDStr, update: EnrollmentUpdate):
+    key = id_key(enrollment_id)
+    if key not in enrollments:
         raise HTTPException(status_code=404, detail="Enrollment not found")
-    stored = enrollments[enrollment_id].model_dump()
-    stored.update(update.model_dump(exclude_unset=True))
-    enrollments[enrollment_id] = EnrollmentRead(**stored)
-    return enrollments[enrollment_id]
+    updated = apply_patch(enrollments[key], update)
+    save(enrollments, enrollment_index, enrollments_json, enrollments_order, key, updated)
+    return json_response(enrollments_json[key])
 
 @app.put("/enrollments/{enrollment_id}", response_model=EnrollmentRead)
-def replace_enrollment(enrollment_id: UUID, enrollment: EnrollmentCreate):
+def replace_enrollment(enrollment_id: UUIDStr, enrollment: EnrollmentCreate):
     """Replace entire enrollment resource (PUT - complete replacement)."""
-    if enrollment_id not in enrollments:
+    key = id_key(enrollment_id)
+    if key not in enrollments:
         raise HTTPException(status_code=404, detail="Enrollment not found")
-    existing = enrollments[enrollment_id]
-    enrollment_read = EnrollmentRead(
-        id=enrollment_id,
+    existing = enrollments[key]
+    enrollment_read = EnrollmentRead.model_construct(
+        id=existing.id,
         created_at=existing.created_at,  
         updated_at=datetime.utcnow(),    # Update the modification time
-        **enrollment.model_dump()
+        **enrollment.__dict__
     )
-    enrollments[enrollment_id] = enrollment_read
-    return enrollment_read
+    save(enrollments, enrollment_index, enrollments_json, enrollments_order, key, enrollment_read)
+    return json_response(enrollments_json[key])
 
 @app.delete("/enrollments/{enrollment_id}")
-def delete_enrollment(enrollment_id: UUID):
+def delete_enrollment(enrollment_id: UUIDStr):
     """Delete an enrollment resource."""
-    if enrollment_id not in enrollments:
+    key = id_key(enrollment_id)
+    if key not in enrollments:
         raise HTTPException(status_code=404, detail="Enrollment not found")
-    del enrollments[enrollment_id]
+    discard(enrollments, enrollment_index, enrollments_json, enrollments_order, key)
     return {"message": "Enrollment deleted successfully"}
 
 # -----------------------------------------------------------------------------
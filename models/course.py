@@ -3,7 +3,7 @@ from __future__ import annotations
 from typing import Optional, Annotated
 from uuid import UUID, uuid4
 from datetime import datetime
-from pydantic import BaseModel, Field, StringConstraints
+from pydantic import BaseModel, Field, PrivateAttr, StringConstraints
 
 from .person import UNIType
 
@@ -136,6 +136,16 @@ class CourseRead(CourseBase):
         json_schema_extra={"example": "2025-01-16T12:00:00Z"},
     )
 
+    # Lowercased name cached at construction for case-insensitive name search.
+    _name_lower: str = PrivateAttr(default="")
+
+    def model_post_init(self, __context) -> None:
+        self._name_lower = self.name.lower()
+
+    @property
+    def name_lower(self) -> str:
+        return self._name_lower
+
     model_config = {
         "json_schema_extra": {
             "examples": [
@@ -182,6 +182,16 @@ class PersonRead(PersonBase):
         json_schema_extra={"example": "2025-01-16T12:00:00Z"},
     )
 
+    @property
+    def address_cities(self) -> frozenset[str]:
+        """Cities of all linked addresses (used to index the nested address filters)."""
+        return frozenset(addr.city for addr in self.addresses)
+
+    @property
+    def address_countries(self) -> frozenset[str]:
+        """Countries of all linked addresses."""
+        return frozenset(addr.country for addr in self.addresses)
+
     model_config = {
         "json_schema_extra": {
             "examples": [